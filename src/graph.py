@@ -1,7 +1,7 @@
 """
 LangGraph implementation for the Question Answering System.
 
-This implementation now uses a vector database (ChromaDB) to:
+This implementation now uses a vector index (in-memory FAISS) to:
 1. Embed document chunks when loading content
 2. Store embeddings in the vector database
 3. For a given question, embed the question and search for the most relevant chunks
@@ -10,6 +10,8 @@ This implementation now uses a vector database (ChromaDB) to:
 This approach is more efficient and accurate for large documents compared to the previous
 implementation that processed all chunks.
 """
+import os
+from functools import lru_cache
 from typing import List, Dict, Any
 from langgraph.graph import StateGraph, END
 from typing_extensions import TypedDict
@@ -17,8 +19,8 @@ from langchain_core.documents import Document
 
 from src.nodes.loaders import load_content
 from src.nodes.text_splitter import split_documents
-from src.nodes.vector_store import create_vector_store, search_relevant_chunks
-from src.nodes.answer_node import answer_question_node  # Updated import
+from src.nodes.vector_store import create_vector_store, search_relevant_chunks, warm_embeddings_model
+from src.nodes.answer_node import answer_question_node, stream_answer_node
 
 
 # Define the state schema for our graph
@@ -35,7 +37,7 @@ class GraphState(TypedDict):
     chunk_size: int
     chunk_overlap: int
     max_answer_length: int
-    vector_store: Any  # Chroma vector store
+    vector_store: Any  # In-memory FAISS vector store
 
 def load_content_node(state: GraphState) -> Dict[str, Any]:
     """Load content from various sources."""
@@ -43,8 +45,26 @@ def load_content_node(state: GraphState) -> Dict[str, Any]:
     return {"documents": documents}
 
 
+def route_by_document_size(state: GraphState) -> str:
+    """Route small documents straight to answering, skipping retrieval.
+
+    When the whole document fits comfortably in the LLM context window,
+    embedding and similarity search are pure overhead — the LLM can
+    attend over the full text directly.
+    """
+    threshold = int(os.getenv("SMALL_DOC_THRESHOLD", 20_000))
+    total_chars = sum(len(document.page_content) for document in state["documents"])
+    return "small" if total_chars < threshold else "large"
+
+
 def split_documents_node(state: GraphState) -> Dict[str, Any]:
-    """Split documents into chunks."""
+    """Split documents into chunks.
+
+    First node on the large route, so this is where the embeddings
+    model warm-up starts: the load overlaps with splitting, and small
+    documents — which never embed anything — never trigger it.
+    """
+    warm_embeddings_model()
     chunks = split_documents(
         state["documents"], 
         state["chunk_size"], 
@@ -54,8 +74,12 @@ def split_documents_node(state: GraphState) -> Dict[str, Any]:
 
 
 def create_vector_store_node(state: GraphState) -> Dict[str, Any]:
-    """Create vector store from document chunks."""
-    vector_store = create_vector_store(state["chunks"])
+    """Create vector store from document chunks.
+
+    The question is known upfront, so its embedding is computed in
+    parallel with the chunk embeddings inside create_vector_store.
+    """
+    vector_store = create_vector_store(state["chunks"], question=state["question"])
     return {"vector_store": vector_store}
 
 
@@ -74,16 +98,23 @@ def search_relevant_chunks_node(state: GraphState) -> Dict[str, Any]:
 
 def answer_question_node_wrapper(state: GraphState) -> Dict[str, Any]:
     """Answer question directly using relevant chunks."""
+    # Small documents bypass retrieval, so fall back to the full document
+    context_chunks = state["relevant_chunks"] or state["documents"]
     final_answer = answer_question_node(
-        state["relevant_chunks"],
+        context_chunks,
         state["question"],
         state["max_answer_length"]
     )
     return {"final_answer": final_answer}
 
 
+@lru_cache(maxsize=1)
 def create_graph():
-    """Create and compile the LangGraph workflow."""
+    """Create and compile the LangGraph workflow.
+
+    The compiled graph is stateless (all per-question data lives in
+    GraphState), so it is built once and cached for subsequent questions.
+    """
     # Create the graph
     workflow = StateGraph(GraphState)
     
@@ -94,8 +125,12 @@ def create_graph():
     workflow.add_node("search_relevant_chunks", search_relevant_chunks_node)
     workflow.add_node("answer_question", answer_question_node_wrapper)  # Updated node
     
-    # Add edges
-    workflow.add_edge("load_content", "split_documents")
+    # Add edges; small documents skip chunking and retrieval entirely
+    workflow.add_conditional_edges(
+        "load_content",
+        route_by_document_size,
+        {"small": "answer_question", "large": "split_documents"}
+    )
     workflow.add_edge("split_documents", "create_vector_store")
     workflow.add_edge("create_vector_store", "search_relevant_chunks")
     workflow.add_edge("search_relevant_chunks", "answer_question")  # Updated edge
@@ -135,13 +170,12 @@ def answer_question_with_graph(
         str: Answer to the question
     """
     # Use defaults from environment variables if not provided
-    import os
     if chunk_size is None:
         chunk_size = int(os.getenv("CHUNK_SIZE", 500))
     if chunk_overlap is None:
         chunk_overlap = int(os.getenv("CHUNK_OVERLAP", 50))
     
-    # Create the graph
+    # Create the graph (cached after the first call)
     app = create_graph()
     
     # Initialize the state
@@ -162,5 +196,100 @@ def answer_question_with_graph(
     
     # Execute the graph
     final_state = app.invoke(initial_state)
-    
-    return final_state["final_answer"]
\ No newline at end of file
+
+    return final_state["final_answer"]
+
+
+def _retrieve_context_chunks(
+    input_type: str,
+    content: str,
+    question: str,
+    chunk_size: int = None,
+    chunk_overlap: int = None
+) -> List[Document]:
+    """Run the retrieval pipeline as straight-line calls.
+
+    Loads the content, routes small documents past retrieval, and
+    otherwise chunks, indexes, and searches — the same steps as the
+    compiled graph, without the per-node state dict copying that
+    StateGraph.invoke does on a strictly linear DAG.
+    """
+    documents = load_content(input_type, content)
+
+    if route_by_document_size({"documents": documents}) == "small":
+        return documents
+
+    # Large route only: overlap the embeddings model load with
+    # splitting, without making small-document runs (or CLI exit) wait
+    # on a speculative load
+    warm_embeddings_model()
+
+    chunks = split_documents(documents, chunk_size, chunk_overlap)
+    vector_store = create_vector_store(chunks, question=question)
+    return search_relevant_chunks(vector_store, question, k=4)
+
+
+def answer_question_direct(
+    input_type: str,
+    content: str,
+    question: str,
+    chunk_size: int = None,
+    chunk_overlap: int = None,
+    max_answer_length: int = None
+) -> str:
+    """
+    Answer a question without going through the compiled StateGraph.
+
+    Fast path for one-off callers like the CLI: the pipeline is a
+    strictly linear sequence here, so the graph scheduler adds only
+    overhead. create_graph/answer_question_with_graph remain for
+    callers that want LangGraph features.
+
+    Args:
+        input_type (str): Type of input source ("url", "pdf", "textfile", "text")
+        content (str): The actual content identifier (URL, file path, or text)
+        question (str): Question to answer based on the content
+        chunk_size (int, optional): Size of each chunk in characters
+        chunk_overlap (int, optional): Overlap between chunks in characters
+        max_answer_length (int, optional): Maximum number of sentences in the final answer
+
+    Returns:
+        str: Answer to the question
+    """
+    context_chunks = _retrieve_context_chunks(
+        input_type, content, question, chunk_size, chunk_overlap
+    )
+    return answer_question_node(context_chunks, question, max_answer_length)
+
+
+def stream_answer_with_graph(
+    input_type: str,
+    content: str,
+    question: str,
+    chunk_size: int = None,
+    chunk_overlap: int = None,
+    max_answer_length: int = None
+):
+    """
+    Stream the answer to a question, yielding tokens as the LLM produces them.
+
+    Runs the same pipeline as answer_question_with_graph (load, route by
+    size, chunk, index, retrieve) but streams the final LLM call so UIs
+    can render the answer incrementally — time-to-first-token drops from
+    the full generation time to roughly one round trip.
+
+    Args:
+        input_type (str): Type of input source ("url", "pdf", "textfile", "text")
+        content (str): The actual content identifier (URL, file path, or text)
+        question (str): Question to answer based on the content
+        chunk_size (int, optional): Size of each chunk in characters
+        chunk_overlap (int, optional): Overlap between chunks in characters
+        max_answer_length (int, optional): Maximum number of sentences in the final answer
+
+    Yields:
+        str: Answer token chunks
+    """
+    context_chunks = _retrieve_context_chunks(
+        input_type, content, question, chunk_size, chunk_overlap
+    )
+    yield from stream_answer_node(context_chunks, question, max_answer_length)
\ No newline at end of file
@@ -17,7 +17,7 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 # Load environment variables
 load_dotenv(override=True)
 
-from src.graph import answer_question_with_graph
+from src.graph import answer_question_direct
 
 
 def main():
@@ -84,8 +84,8 @@ def main():
         sys.exit(1)
 
     try:
-        # Run the question answering pipeline with LangGraph
-        answer = answer_question_with_graph(
+        # Run the question answering pipeline on the direct fast path
+        answer = answer_question_direct(
             input_type=input_type,
             content=content,
             question=args.question,
@@ -7,15 +7,16 @@ of relevant chunks, we can answer the question directly without chunking.
 """
 from typing import List
 from langchain_core.documents import Document
-from langchain_core.prompts import PromptTemplate
 from langchain_openai import ChatOpenAI
 
 from src.utils.llm_utils import initialize_llm
 
 
-# Prompt template for answering questions based on relevant chunks
-ANSWER_QUESTION_PROMPT = PromptTemplate.from_template("""
-Use ONLY the following relevant context to answer the question. 
+# Prompt template for answering questions based on relevant chunks.
+# A plain format string: str.format skips PromptTemplate's per-call
+# variable validation on this hot path.
+ANSWER_QUESTION_PROMPT = """
+Use ONLY the following relevant context to answer the question.
 If the context does not contain enough information to answer the question, say "I don't have enough information in the provided document to answer this question."
 Do not use any external knowledge or make assumptions beyond what is stated in the context.
 Keep the answer concise and factual.
@@ -25,43 +26,73 @@ Relevant Context: {context}
 Question: {question}
 
 {answer_length_instruction}
-""")
+"""
+
+
+def _build_prompt(
+    relevant_chunks: List[Document],
+    question: str,
+    max_answer_length: int = None
+) -> str:
+    """Build the answer prompt from the relevant chunks and question."""
+    # Combine all relevant chunks into a single context; the generator
+    # skips the intermediate list allocation
+    combined_context = "\n\n".join(chunk.page_content for chunk in relevant_chunks)
+
+    # Prepare the answer length instruction
+    answer_length_instruction = ""
+    if max_answer_length:
+        answer_length_instruction = f"Answer in no more than {max_answer_length} sentences."
+
+    return ANSWER_QUESTION_PROMPT.format(
+        context=combined_context,
+        question=question,
+        answer_length_instruction=answer_length_instruction
+    )
 
 
 def answer_question_node(
-    relevant_chunks: List[Document], 
+    relevant_chunks: List[Document],
     question: str,
     max_answer_length: int = None
 ) -> str:
     """
     Answer a question based on relevant document chunks from vector database.
-    
+
     Args:
         relevant_chunks (List[Document]): List of relevant document chunks from vector search
         question (str): Question to answer based on the chunks
         max_answer_length (int, optional): Maximum number of sentences in the answer
-        
+
     Returns:
         str: Answer to the question
     """
     # Initialize LLM
     llm = initialize_llm()
-    
-    # Combine all relevant chunks into a single context
-    combined_context = "\n\n".join([chunk.page_content for chunk in relevant_chunks])
-    
-    # Prepare the answer length instruction
-    answer_length_instruction = ""
-    if max_answer_length:
-        answer_length_instruction = f"Answer in no more than {max_answer_length} sentences."
-    
-    # Format the prompt
-    prompt = ANSWER_QUESTION_PROMPT.format(
-        context=combined_context,
-        question=question,
-        answer_length_instruction=answer_length_instruction
-    )
-    
+
+    prompt = _build_prompt(relevant_chunks, question, max_answer_length)
+
     # Get the answer from the LLM
     response = llm.invoke(prompt)
-    return response.content
\ No newline at end of file
+    return response.content
+
+
+def stream_answer_node(
+    relevant_chunks: List[Document],
+    question: str,
+    max_answer_length: int = None
+):
+    """
+    Stream the answer tokens as they arrive from the LLM.
+
+    Same prompt as answer_question_node, but yields str token chunks so
+    UIs can render the answer incrementally instead of waiting for the
+    full generation.
+    """
+    llm = initialize_llm()
+
+    prompt = _build_prompt(relevant_chunks, question, max_answer_length)
+
+    for chunk in llm.stream(prompt):
+        if chunk.content:
+            yield chunk.content
\ No newline at end of file
@@ -3,45 +3,134 @@ Text splitting utility for chunking large documents.
 
 This utility splits documents into chunks that will be embedded and stored
 in a vector database for efficient similarity search.
+
+The default path is a Numba-compiled window scanner: the text is viewed
+as a uint32 code-point array and chunk boundaries are computed in native
+code, avoiding RecursiveCharacterTextSplitter's per-character Python
+loops. The LangChain splitter remains as a fallback when numba is not
+installed.
 """
 from typing import List
 from langchain_core.documents import Document
-from langchain_text_splitters import RecursiveCharacterTextSplitter
+from langchain_text_splitters import RecursiveCharacterTextSplitter, TokenTextSplitter
+import numpy as np
 import os
 
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+
+def _scan_chunk_bounds(codes, chunk_size, chunk_overlap, bounds):
+    """Fill `bounds` with (start, end) chunk index pairs; return the count.
+
+    Starts advance by a fixed stride of chunk_size - chunk_overlap. Each
+    chunk end is pulled back to the nearest separator (newline, period,
+    space), but never by more than chunk_overlap, so consecutive chunks
+    always cover the text with no gaps. Compiled with numba when
+    available.
+    """
+    n = codes.shape[0]
+    stride = chunk_size - chunk_overlap
+    count = 0
+    start = 0
+    while start < n:
+        end_full = start + chunk_size
+        if end_full > n:
+            end_full = n
+        end = end_full
+        if end_full < n:
+            # Prefer ending on a separator within the overlap window
+            split = end_full
+            while split > end_full - chunk_overlap:
+                code = codes[split - 1]
+                if code == 10 or code == 46 or code == 32:
+                    break
+                split -= 1
+            if split > end_full - chunk_overlap:
+                end = split
+        bounds[count, 0] = start
+        bounds[count, 1] = end
+        count += 1
+        if end_full == n:
+            break
+        start += stride
+    return count
+
+
+if njit is not None:
+    _scan_chunk_bounds = njit(cache=True)(_scan_chunk_bounds)
+
+
+def _fast_split_text(text: str, chunk_size: int, chunk_overlap: int) -> List[str]:
+    """Split a string into overlapping chunks via the compiled scanner."""
+    # utf-32-le yields exactly one uint32 per code point, so scanner
+    # indices are valid indices into the original string
+    codes = np.frombuffer(text.encode("utf-32-le"), dtype=np.uint32)
+    stride = chunk_size - chunk_overlap
+    bounds = np.empty((len(codes) // stride + 2, 2), dtype=np.int64)
+    count = _scan_chunk_bounds(codes, chunk_size, chunk_overlap, bounds)
+
+    chunks = []
+    for i in range(count):
+        chunk = text[bounds[i, 0]:bounds[i, 1]].strip()
+        if chunk:
+            chunks.append(chunk)
+    return chunks
+
 
 def split_documents(
-    documents: List[Document], 
-    chunk_size: int = None, 
+    documents: List[Document],
+    chunk_size: int = None,
     chunk_overlap: int = None
 ) -> List[Document]:
     """
     Split documents into smaller chunks.
-    
+
     Args:
         documents (List[Document]): List of Document objects to split
         chunk_size (int, optional): Size of each chunk in characters
-        chunk_overlap (int, optional): Overlap between chunks in characters
-        
+            (or tokens when CHUNK_UNIT=tokens)
+        chunk_overlap (int, optional): Overlap between chunks in
+            characters (or tokens when CHUNK_UNIT=tokens)
+
     Returns:
         List[Document]: List of chunked Document objects
     """
     # Use provided values or get from environment variables
     if chunk_size is None:
         chunk_size = int(os.getenv("CHUNK_SIZE", 500))
-    
+
     if chunk_overlap is None:
         chunk_overlap = int(os.getenv("CHUNK_OVERLAP", 50))
 
+    # Optional token-aware mode: chunks measured in cl100k_base tokens
+    # line up with what the LLM actually consumes, so no context budget
+    # is wasted on chunks that overshoot their character estimate
+    if os.getenv("CHUNK_UNIT", "chars") == "tokens":
+        token_splitter = TokenTextSplitter(
+            encoding_name="cl100k_base",
+            chunk_size=chunk_size,
+            chunk_overlap=chunk_overlap,
+        )
+        return token_splitter.split_documents(documents)
 
-    # Create text splitter
+    if njit is not None and 0 < chunk_overlap < chunk_size:
+        splits = []
+        for document in documents:
+            for chunk in _fast_split_text(document.page_content, chunk_size, chunk_overlap):
+                splits.append(Document(page_content=chunk, metadata=dict(document.metadata)))
+        return splits
+
+    # Fallback: LangChain's pure-Python recursive splitter
     text_splitter = RecursiveCharacterTextSplitter(
         chunk_size=chunk_size,
         chunk_overlap=chunk_overlap,
         length_function=len,
         is_separator_regex=False,
     )
-    
+
     # Split documents
     splits = text_splitter.split_documents(documents)
-    return splits
\ No newline at end of file
+    return splits
@@ -96,6 +96,7 @@ content_type = st.selectbox(
 
 content = None
 temp_file_path = None
+input_type = content_type
 
 # Display appropriate input field based on content type
 if content_type == "url":
@@ -108,9 +109,10 @@ elif content_type == "pdf":
             st.error("❌ File size exceeds 1MB limit. Please upload a smaller file.")
             st.stop()
         
-        # Save uploaded file to a temporary location
+        # Save uploaded file to a temporary location; getbuffer() writes
+        # the upload's memoryview directly without copying it first
         with tempfile.NamedTemporaryFile(delete=False, suffix=".pdf") as temp_file:
-            temp_file.write(uploaded_file.getvalue())
+            temp_file.write(uploaded_file.getbuffer())
             temp_file_path = temp_file.name
         content = temp_file_path
 elif content_type == "textfile":
@@ -121,11 +123,10 @@ elif content_type == "textfile":
             st.error("❌ File size exceeds 1MB limit. Please upload a smaller file.")
             st.stop()
         
-        # Save uploaded file to a temporary location
-        with tempfile.NamedTemporaryFile(delete=False, suffix=".txt") as temp_file:
-            temp_file.write(uploaded_file.getvalue())
-            temp_file_path = temp_file.name
-        content = temp_file_path
+        # No temp file needed for plain text: decode the upload in memory
+        # and route it through the direct-text path
+        content = uploaded_file.getvalue().decode("utf-8", errors="replace")
+        input_type = "text"
 elif content_type == "text":
     content = st.text_area("Enter text", height=200, placeholder="Paste your text here...")
 
@@ -143,24 +144,22 @@ if st.button("❓ Answer Question", type="primary", use_container_width=True):
         # Show processing status
         with st.spinner("Processing your content and answering your question..."):
             try:
-                # Import the question answering function
-                from src.graph import answer_question_with_graph
-                
-                # Run the async function (if needed)
-                answer = answer_question_with_graph(
-                    input_type=content_type,
+                # Import the streaming question answering function
+                from src.graph import stream_answer_with_graph
+
+                # Render answer tokens as the LLM produces them
+                st.subheader("Answer")
+                st.write_stream(stream_answer_with_graph(
+                    input_type=input_type,
                     content=content,
                     question=question,
                     chunk_size=chunk_size,
                     chunk_overlap=chunk_overlap,
                     max_answer_length=max_answer_length if max_answer_length > 0 else None
-                )
-                
-                # Display the result
+                ))
+
                 st.success("✅ Answer generated successfully!")
-                st.subheader("Answer")
-                st.markdown(answer)
-                
+
             except Exception as e:
                 st.error(f"❌ Error during question answering: {str(e)}")
                 
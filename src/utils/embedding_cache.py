@@ -0,0 +1,86 @@
+"""
+SQLite-backed embedding cache for the LangGraph Question Answering System.
+
+The chunk text -> vector mapping is deterministic per embedding model, so
+re-asking about the same document should not re-run the model. Vectors are
+keyed by a content hash plus the model name and persist across sessions.
+"""
+import hashlib
+import os
+import sqlite3
+from typing import List
+
+import numpy as np
+from langchain_core.embeddings import Embeddings
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS embeddings (
+    hash TEXT NOT NULL,
+    model_name TEXT NOT NULL,
+    vector BLOB NOT NULL,
+    UNIQUE (hash, model_name)
+)
+"""
+
+
+def _connect() -> sqlite3.Connection:
+    """Open the cache database, creating the schema if needed."""
+    db_path = os.getenv("EMBEDDING_CACHE_PATH", "./embedding_cache.db")
+    connection = sqlite3.connect(db_path)
+    connection.execute(_SCHEMA)
+    return connection
+
+
+def _text_hash(text: str) -> str:
+    """Return a stable 128-bit content hash for a chunk of text."""
+    return hashlib.blake2b(text.encode(), digest_size=16).hexdigest()
+
+
+def cached_embed_documents(
+    embeddings_model: Embeddings,
+    model_name: str,
+    texts: List[str]
+) -> np.ndarray:
+    """
+    Embed texts through the cache, computing only the misses.
+
+    Args:
+        embeddings_model (Embeddings): Model used to embed cache misses
+        model_name (str): Name of the embedding model (part of the cache key)
+        texts (List[str]): Texts to embed
+
+    Returns:
+        np.ndarray: float32 matrix of embeddings in input order
+    """
+    connection = _connect()
+    try:
+        hashes = [_text_hash(text) for text in texts]
+
+        # Look up cached vectors; remember which rows are missing
+        vectors = [None] * len(texts)
+        for i, text_hash in enumerate(hashes):
+            row = connection.execute(
+                "SELECT vector FROM embeddings WHERE hash = ? AND model_name = ?",
+                (text_hash, model_name)
+            ).fetchone()
+            if row is not None:
+                vectors[i] = np.frombuffer(row[0], dtype=np.float32)
+
+        # Embed all misses in one batched call and store them
+        misses = [i for i, vector in enumerate(vectors) if vector is None]
+        if misses:
+            new_vectors = embeddings_model.embed_documents([texts[i] for i in misses])
+            rows = []
+            for i, new_vector in zip(misses, new_vectors):
+                vector = np.asarray(new_vector, dtype=np.float32)
+                vectors[i] = vector
+                rows.append((hashes[i], model_name, vector.tobytes()))
+            connection.executemany(
+                "INSERT OR IGNORE INTO embeddings (hash, model_name, vector) VALUES (?, ?, ?)",
+                rows
+            )
+            connection.commit()
+
+        return np.stack(vectors)
+    finally:
+        connection.close()